@@ -1,15 +1,35 @@
 """LNbits API client for MCP server."""
 
 import asyncio
+import logging
+import math
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple, cast
 
 import httpx
+import orjson
 import structlog
 
 from .utils.auth import AuthConfig, AuthMethod
+from .utils.logs import log_enabled
+from .utils.rate_limiter import TokenBucket
+from .utils.ttl_cache import TTLCache
 
 logger = structlog.get_logger(__name__)
+# Stdlib logger behind it, fetched once for log_enabled checks
+_log = logging.getLogger(__name__)
+
+# Sentinel distinguishing a cache miss from a cached JSON null
+_MISSING = object()
+
+# LNURL-pay metadata for a lightning address changes rarely
+_LNURL_CACHE_TTL = 3600.0
+
+# Bytes of a non-JSON error body to include in LNbitsError messages
+_ERROR_BODY_LIMIT = 200
+
+# user@domain.tld, capturing (user, domain)
+_LN_ADDRESS_RE = re.compile(r"^([^@]+)@([^@]+\.[^@]+)$")
 
 
 # -- Re-export config/error so existing imports keep working --
@@ -47,6 +67,22 @@ class LNbitsConfig(BaseSettings):
         default=3, description="Maximum number of retries for failed requests"
     )
     rate_limit_per_minute: int = Field(default=60, description="Rate limit per minute")
+    max_concurrent: int = Field(
+        default=20, description="Maximum number of in-flight requests"
+    )
+    cache_ttl: float = Field(
+        default=2.0, description="Seconds to cache GET responses (0 disables)"
+    )
+    http2_enabled: bool = Field(
+        default=True, description="Use HTTP/2 for connections to LNbits"
+    )
+    max_connections: int = Field(
+        default=20,
+        description=(
+            "Maximum pooled connections to the LNbits host "
+            "(never fewer than max_concurrent)"
+        ),
+    )
 
     model_config = {
         "env_prefix": "LNBITS_",
@@ -74,25 +110,78 @@ class LNbitsClient:
             oauth2_token=self.config.oauth2_token,
             auth_method=self.config.auth_method,
         )
+        # Empty for every auth method except api_key_query
+        self._auth_query = self.auth_config.get_query_params()
+        # Stringifying a pydantic HttpUrl normalizes it each time; do it once
+        self.base_url = str(self.config.lnbits_url).rstrip("/")
         self.client: Optional[httpx.AsyncClient] = None
-        self._rate_limiter = asyncio.Semaphore(self.config.rate_limit_per_minute)
+        # Separate pooled client for third-party LNURL hosts (no base_url)
+        self._lnurl_client: Optional[httpx.AsyncClient] = None
+        self._rate_limiter = TokenBucket(self.config.rate_limit_per_minute, 60)
+        self._concurrency = asyncio.Semaphore(self.config.max_concurrent)
+        # In-flight GET requests keyed by (write generation, _request_key),
+        # shared by identical calls
+        self._inflight: Dict[Tuple[Any, ...], "asyncio.Task[Any]"] = {}
+        # Raw GET response bodies; decoded per caller so results aren't shared
+        self._get_cache = TTLCache(self.config.cache_ttl)
+        # Bumped when a non-GET request starts and ends; a GET only caches its
+        # result if no write overlapped it
+        self._write_generation = 0
+        self._lnurl_cache = TTLCache(_LNURL_CACHE_TTL)
 
     async def __aenter__(self):
         await self._ensure_client()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self) -> None:
+        """Close pooled HTTP connections. The client reopens them on next use."""
         if self.client:
             await self.client.aclose()
+            self.client = None
+        if self._lnurl_client:
+            await self._lnurl_client.aclose()
+            self._lnurl_client = None
 
     async def _ensure_client(self):
         if not self.client:
+            # One connection per permitted in-flight request, so HTTP/1.1
+            # fallbacks never queue on the pool behind the semaphore
+            pool_size = max(self.config.max_connections, self.config.max_concurrent)
             self.client = httpx.AsyncClient(
-                base_url=str(self.config.lnbits_url),
+                base_url=self.base_url,
                 timeout=self.config.timeout,
                 headers=self.auth_config.get_headers(),
+                http2=self.config.http2_enabled,
+                limits=httpx.Limits(
+                    max_keepalive_connections=pool_size,
+                    max_connections=pool_size,
+                    keepalive_expiry=30.0,
+                ),
+            )
+        if not self._lnurl_client:
+            self._lnurl_client = httpx.AsyncClient(
+                timeout=self.config.timeout,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                http2=self.config.http2_enabled,
             )
 
+    async def get_http_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client for the LNbits instance."""
+        await self._ensure_client()
+        client = self.client
+        assert client is not None  # set by _ensure_client
+        return client
+
+    async def _get_lnurl_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client for third-party LNURL hosts."""
+        await self._ensure_client()
+        client = self._lnurl_client
+        assert client is not None  # set by _ensure_client
+        return client
+
     # ------------------------------------------------------------------
     # Core HTTP methods (used by the generic dispatcher)
     # ------------------------------------------------------------------
@@ -105,42 +194,135 @@ class LNbitsClient:
         json: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
     ) -> Any:
-        """Make an authenticated request to the LNbits API."""
+        """Make an authenticated request to the LNbits API.
+
+        Concurrent identical GET requests are coalesced into a single
+        upstream call, and GET responses are cached for ``cache_ttl`` seconds.
+        Every caller gets its own decoded copy of the response. Any other
+        method invalidates the GET cache since it may have changed server
+        state (e.g. the balance).
+        """
+        if method.upper() != "GET":
+            self._write_generation += 1
+            try:
+                return orjson.loads(
+                    await self._send(method, path, params, json, **kwargs)
+                )
+            finally:
+                self._write_generation += 1
+                self._get_cache.clear()
+
+        key = self._request_key(path, params, kwargs.get("headers"))
+        if self.config.cache_ttl > 0:
+            cached = self._get_cache.get(key, _MISSING)
+            if cached is not _MISSING:
+                return orjson.loads(cached)
+
+        # Only join requests started since the last write began or ended
+        generation = self._write_generation
+        inflight_key = (generation, key)
+        task = self._inflight.get(inflight_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._send_cached(key, generation, method, path, params, json, **kwargs)
+            )
+            self._inflight[inflight_key] = task
+            task.add_done_callback(lambda t: self._forget_inflight(inflight_key, t))
+        # Shield so one caller being cancelled does not cancel the others
+        return orjson.loads(await asyncio.shield(task))
+
+    @staticmethod
+    def _request_key(
+        path: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+    ) -> Tuple[Any, ...]:
+        return (
+            path,
+            tuple(sorted((k, str(v)) for k, v in (params or {}).items())),
+            tuple(sorted((headers or {}).items())),
+        )
+
+    def _forget_inflight(self, key: Tuple[Any, ...], task: "asyncio.Task[Any]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved; awaiting callers re-raise it
+            task.exception()
+
+    async def _send_cached(
+        self, key: Tuple[Any, ...], generation: int, *args: Any, **kwargs: Any
+    ) -> bytes:
+        content = await self._send(*args, **kwargs)
+        # A write that overlapped this request may have made it stale
+        if self.config.cache_ttl > 0 and generation == self._write_generation:
+            self._get_cache.set(key, content)
+        return content
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> bytes:
+        """Send a request and return the raw body of a successful response."""
         await self._ensure_client()
 
-        if params is None:
-            params = {}
-        params.update(self.auth_config.get_query_params())
+        if self._auth_query:
+            params = {**(params or {}), **self._auth_query}
+
+        if json is not None:
+            # Encode once with orjson instead of letting httpx use stdlib json
+            kwargs["content"] = orjson.dumps(json)
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                "Content-Type": "application/json",
+            }
 
-        async with self._rate_limiter:
+        async with self._concurrency, self._rate_limiter:
             try:
                 response = await self.client.request(
-                    method=method, url=path, params=params, json=json, **kwargs
+                    method=method, url=path, params=params, **kwargs
                 )
 
-                logger.info(
-                    "API request",
-                    method=method,
-                    path=path,
-                    status_code=response.status_code,
-                )
+                if log_enabled(_log, logging.INFO):
+                    logger.info(
+                        "API request",
+                        method=method,
+                        path=path,
+                        status_code=response.status_code,
+                    )
 
                 if response.status_code >= 400:
-                    error_msg = f"API request failed: {response.status_code}"
-                    try:
-                        error_detail = response.json()
-                        if "detail" in error_detail:
-                            error_msg += f" - {error_detail['detail']}"
-                    except Exception:
-                        error_msg += f" - {response.text}"
-                    raise LNbitsError(error_msg, response.status_code)
+                    raise LNbitsError(
+                        self._error_message(response), response.status_code
+                    )
 
-                return response.json()
+                return response.content
 
             except httpx.RequestError as e:
                 logger.error("Request error", error=str(e), path=path)
                 raise LNbitsError(f"Request failed: {e}")
 
+    @staticmethod
+    def _error_message(response: httpx.Response) -> str:
+        """Build an error message from a failed response.
+
+        Uses the JSON ``detail`` field when present; otherwise includes a
+        bounded prefix of the raw body so huge error pages aren't decoded.
+        """
+        prefix = f"API request failed: {response.status_code}"
+        try:
+            error_detail = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            snippet = response.content[:_ERROR_BODY_LIMIT]
+            return f"{prefix} - {snippet.decode('utf-8', errors='replace')}"
+        if isinstance(error_detail, dict) and "detail" in error_detail:
+            return f"{prefix} - {error_detail['detail']}"
+        return prefix
+
     async def get(self, path: str, **kwargs: Any) -> Any:
         return await self._request("GET", path, **kwargs)
 
@@ -162,21 +344,33 @@ class LNbitsClient:
 
     async def resolve_lightning_address(self, lightning_address: str) -> Optional[str]:
         """Resolve a Lightning address to an LNURL-pay callback URL."""
-        if not re.match(r"^[^@]+@[^@]+\.[^@]+$", lightning_address):
+        lnurl_data = await self._resolve_lnurl_pay(lightning_address)
+        return lnurl_data["callback"] if lnurl_data else None
+
+    async def _resolve_lnurl_pay(
+        self, lightning_address: str
+    ) -> Optional[Dict[str, Any]]:
+        """Return the (cached) LNURL-pay metadata for a Lightning address."""
+        match = _LN_ADDRESS_RE.match(lightning_address)
+        if not match:
             raise LNbitsError(f"Invalid lightning address format: {lightning_address}")
+        cached = self._lnurl_cache.get(lightning_address)
+        if cached is not None:
+            return cast(Dict[str, Any], cached)
         try:
-            user, domain = lightning_address.split("@")
+            user, domain = match.groups()
             well_known_url = f"https://{domain}/.well-known/lnurlp/{user}"
-            async with httpx.AsyncClient(timeout=self.config.timeout) as client:
-                response = await client.get(well_known_url)
-                if response.status_code != 200:
-                    return None
-                lnurl_data = response.json()
-                if not all(
-                    k in lnurl_data for k in ("callback", "minSendable", "maxSendable")
-                ):
-                    return None
-                return lnurl_data["callback"]
+            lnurl_client = await self._get_lnurl_client()
+            response = await lnurl_client.get(well_known_url)
+            if response.status_code != 200:
+                return None
+            lnurl_data = orjson.loads(response.content)
+            if not isinstance(lnurl_data, dict) or not all(
+                k in lnurl_data for k in ("callback", "minSendable", "maxSendable")
+            ):
+                return None
+            self._lnurl_cache.set(lightning_address, lnurl_data)
+            return lnurl_data
         except Exception as e:
             logger.error("Error resolving lightning address", error=str(e))
             return None
@@ -189,14 +383,14 @@ class LNbitsClient:
             params: Dict[str, Any] = {"amount": amount_msats}
             if comment:
                 params["comment"] = comment
-            async with httpx.AsyncClient(timeout=self.config.timeout) as client:
-                response = await client.get(callback_url, params=params)
-                if response.status_code != 200:
-                    return None
-                data = response.json()
-                if "reason" in data:
-                    return None
-                return data.get("pr")
+            lnurl_client = await self._get_lnurl_client()
+            response = await lnurl_client.get(callback_url, params=params)
+            if response.status_code != 200:
+                return None
+            data = orjson.loads(response.content)
+            if "reason" in data:
+                return None
+            return data.get("pr")
         except Exception as e:
             logger.error("Error getting LNURL-pay invoice", error=str(e))
             return None
@@ -206,18 +400,49 @@ class LNbitsClient:
     ) -> Dict[str, Any]:
         """Resolve → callback → invoice → pay."""
         amount_msats = amount_sats * 1000
-        callback_url = await self.resolve_lightning_address(lightning_address)
-        if not callback_url:
-            raise LNbitsError(
-                f"Failed to resolve lightning address: {lightning_address}"
+        was_cached = self._lnurl_cache.get(lightning_address) is not None
+        try:
+            invoice = await self._fetch_lnurl_invoice(
+                lightning_address, amount_msats, comment
+            )
+        except LNbitsError:
+            # Cached sendable bounds can be out of date; only fresh ones are final
+            if not was_cached:
+                raise
+            invoice = None
+        if not invoice and was_cached:
+            # The cached metadata may have gone stale; retry once with fresh data
+            self._lnurl_cache.pop(lightning_address)
+            invoice = await self._fetch_lnurl_invoice(
+                lightning_address, amount_msats, comment
             )
-        invoice = await self.get_lnurl_pay_invoice(callback_url, amount_msats, comment)
         if not invoice:
             raise LNbitsError(f"Failed to get invoice for: {lightning_address}")
         return await self.post(
             "/api/v1/payments", json={"out": True, "bolt11": invoice}
         )
 
+    async def _fetch_lnurl_invoice(
+        self, lightning_address: str, amount_msats: int, comment: Optional[str]
+    ) -> Optional[str]:
+        lnurl_data = await self._resolve_lnurl_pay(lightning_address)
+        if not lnurl_data:
+            raise LNbitsError(
+                f"Failed to resolve lightning address: {lightning_address}"
+            )
+        # Reject out-of-range amounts locally instead of via a callback round trip
+        min_msats = int(lnurl_data["minSendable"])
+        max_msats = int(lnurl_data["maxSendable"])
+        if not min_msats <= amount_msats <= max_msats:
+            raise LNbitsError(
+                f"Amount {amount_msats // 1000} sats is outside the range accepted "
+                f"by {lightning_address}: {math.ceil(min_msats / 1000)}-"
+                f"{max_msats // 1000} sats"
+            )
+        return await self.get_lnurl_pay_invoice(
+            lnurl_data["callback"], amount_msats, comment
+        )
+
     async def check_connection(self) -> bool:
         try:
             await self.get("/api/v1/wallet")
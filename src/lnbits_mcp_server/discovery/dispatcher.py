@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
-import json
+import logging
 from typing import Any
-from urllib.parse import quote, urljoin
+from urllib.parse import quote
 
 import structlog
 
 from ..client import LNbitsClient
+from ..utils.logs import log_enabled
+from ..utils.serialization import to_json_text
 from .openapi_parser import DiscoveredOperation
 
 logger = structlog.get_logger(__name__)
+# Stdlib logger behind it, fetched once for log_enabled checks
+_log = logging.getLogger(__name__)
 
 
 class Dispatcher:
@@ -30,6 +34,20 @@ class Dispatcher:
     ) -> str:
         """Build the HTTP request from *op* + *arguments* and return the
         JSON response body as a string (LLMs handle JSON well)."""
+        result = await self.dispatch_raw(
+            client, op, arguments, access_token=access_token
+        )
+        return to_json_text(result)
+
+    async def dispatch_raw(
+        self,
+        client: LNbitsClient,
+        op: DiscoveredOperation,
+        arguments: dict[str, Any],
+        *,
+        access_token: str | None = None,
+    ) -> Any:
+        """Like :meth:`dispatch` but return the decoded response body."""
 
         path = self._substitute_path_params(op.path, arguments)
         query_params, body = self._separate_params(op, arguments)
@@ -39,12 +57,13 @@ class Dispatcher:
         if access_token and self._needs_user_auth(op):
             extra_headers["Authorization"] = f"Bearer {access_token}"
 
-        logger.info(
-            "Dispatching",
-            tool=op.tool_name,
-            method=op.method,
-            path=path,
-        )
+        if log_enabled(_log, logging.INFO):
+            logger.info(
+                "Dispatching",
+                tool=op.tool_name,
+                method=op.method,
+                path=path,
+            )
 
         result = await client._request(
             method=op.method,
@@ -54,9 +73,7 @@ class Dispatcher:
             headers=extra_headers or None,
         )
 
-        result = self._enrich_invoice(result, op, arguments, client)
-
-        return json.dumps(result, indent=2, default=str)
+        return self._enrich_invoice(result, op, arguments, client)
 
     # ------------------------------------------------------------------
     # Post-processing
@@ -82,8 +99,7 @@ class Dispatcher:
         if not bolt11:
             return result
 
-        base_url = str(client.config.lnbits_url).rstrip("/")
-        result["qr_code"] = f"{base_url}/api/v1/qrcode/{quote(bolt11, safe='')}"
+        result["qr_code"] = f"{client.base_url}/api/v1/qrcode/{quote(bolt11, safe='')}"
         result["lightning_uri"] = f"lightning:{bolt11}"
         return result
 
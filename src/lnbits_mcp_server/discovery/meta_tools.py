@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any
+import asyncio
+from typing import Any, Awaitable, Callable
 
 from mcp.types import Tool
 
 from ..client import LNbitsClient, LNbitsError
 from ..utils.runtime_config import RuntimeConfigManager
+from ..utils.serialization import to_json_text
 
 # ─── Tool definitions ────────────────────────────────────────────────
 
+# Shared by the tools that take no arguments
+_NO_ARGS_SCHEMA: dict[str, Any] = {"type": "object", "properties": {}}
+
+# Meta tools that change state; batch_call_tools refuses to run these
+_WRITE_META_TOOL_NAMES: tuple[str, ...] = (
+    "batch_call_tools",
+    "configure_lnbits",
+    "pay_lightning_address",
+    "refresh_tools",
+)
+
 META_TOOL_DEFINITIONS: list[Tool] = [
     Tool(
         name="configure_lnbits",
@@ -67,12 +79,12 @@ META_TOOL_DEFINITIONS: list[Tool] = [
     Tool(
         name="test_connection",
         description="Test the current LNbits connection by making a test API call.",
-        inputSchema={"type": "object", "properties": {}},
+        inputSchema=_NO_ARGS_SCHEMA,
     ),
     Tool(
         name="get_configuration",
         description="Show current LNbits configuration with masked API keys.",
-        inputSchema={"type": "object", "properties": {}},
+        inputSchema=_NO_ARGS_SCHEMA,
     ),
     Tool(
         name="refresh_tools",
@@ -80,12 +92,12 @@ META_TOOL_DEFINITIONS: list[Tool] = [
             "Re-fetch the OpenAPI spec from LNbits and rebuild the tool list. "
             "Use after enabling/disabling extensions."
         ),
-        inputSchema={"type": "object", "properties": {}},
+        inputSchema=_NO_ARGS_SCHEMA,
     ),
     Tool(
         name="list_extensions",
         description="Show all discovered extensions and their tool counts.",
-        inputSchema={"type": "object", "properties": {}},
+        inputSchema=_NO_ARGS_SCHEMA,
     ),
     Tool(
         name="pay_lightning_address",
@@ -115,9 +127,69 @@ META_TOOL_DEFINITIONS: list[Tool] = [
             "required": ["lightning_address", "amount_sats"],
         },
     ),
+    Tool(
+        name="get_wallet_snapshot",
+        description=(
+            "Get wallet details (balance in msats) and recent payments in one "
+            "call. Use at the start of a session instead of separate calls."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "limit": {
+                    "type": "integer",
+                    "description": "Number of recent payments to include",
+                    "minimum": 1,
+                    "maximum": 100,
+                    "default": 10,
+                },
+            },
+        },
+    ),
+    Tool(
+        name="batch_call_tools",
+        description=(
+            "Run several independent read-only tool calls concurrently and "
+            "return all results in order. Only read meta tools and GET "
+            "endpoints may be batched; payments and configuration changes "
+            "must be called directly."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "minItems": 1,
+                    "maxItems": 10,
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {
+                                "type": "string",
+                                "description": "Tool name",
+                                "not": {"enum": list(_WRITE_META_TOOL_NAMES)},
+                            },
+                            "arguments": {
+                                "type": "object",
+                                "description": "Tool arguments",
+                            },
+                        },
+                        "required": ["name"],
+                    },
+                },
+            },
+            "required": ["calls"],
+        },
+    ),
 ]
 
-META_TOOL_NAMES: set[str] = {t.name for t in META_TOOL_DEFINITIONS}
+META_TOOL_NAMES: frozenset[str] = frozenset(t.name for t in META_TOOL_DEFINITIONS)
+
+READ_ONLY_META_TOOL_NAMES: frozenset[str] = META_TOOL_NAMES.difference(
+    _WRITE_META_TOOL_NAMES
+)
+
+_META_TOOLS_BY_NAME: dict[str, Tool] = {t.name: t for t in META_TOOL_DEFINITIONS}
 
 
 class MetaTools:
@@ -128,80 +200,137 @@ class MetaTools:
         # Populated by server after discovery
         self._get_extensions_fn: Any = None
         self._refresh_fn: Any = None
+        self._call_tool_fn: Any = None
+        self._is_read_only_fn: Any = None
+        # Tool name → handler; every handler takes the raw arguments dict and
+        # returns the decoded result, serialized once by call_tool
+        self._handlers: dict[str, Callable[[dict[str, Any]], Awaitable[Any]]] = {
+            "configure_lnbits": self._configure,
+            "test_connection": self._test_connection,
+            "get_configuration": self._get_configuration,
+            "refresh_tools": self._refresh_tools,
+            "list_extensions": self._list_extensions,
+            "pay_lightning_address": self._pay_lightning_address,
+            "get_wallet_snapshot": self._get_wallet_snapshot,
+            "batch_call_tools": self._batch_call_tools,
+        }
 
     def set_callbacks(
         self,
         *,
         refresh_fn: Any = None,
         get_extensions_fn: Any = None,
+        call_tool_fn: Any = None,
+        is_read_only_fn: Any = None,
     ) -> None:
         """Set callbacks that the server provides after init."""
         self._refresh_fn = refresh_fn
         self._get_extensions_fn = get_extensions_fn
+        self._call_tool_fn = call_tool_fn
+        self._is_read_only_fn = is_read_only_fn
 
     @staticmethod
     def get_tools() -> list[Tool]:
         return list(META_TOOL_DEFINITIONS)
 
+    @staticmethod
+    def get_tool(name: str) -> Tool | None:
+        return _META_TOOLS_BY_NAME.get(name)
+
     async def call_tool(self, name: str, arguments: dict[str, Any]) -> str:
         """Dispatch a meta tool call. Returns a text string."""
-        if name == "configure_lnbits":
-            return await self._configure(arguments)
-        if name == "test_connection":
-            return await self._test_connection()
-        if name == "get_configuration":
-            return self._get_configuration()
-        if name == "refresh_tools":
-            return await self._refresh_tools()
-        if name == "list_extensions":
-            return self._list_extensions()
-        if name == "pay_lightning_address":
-            return await self._pay_lightning_address(arguments)
-        raise ValueError(f"Unknown meta tool: {name}")
+        return to_json_text(await self.call_tool_raw(name, arguments))
+
+    async def call_tool_raw(self, name: str, arguments: dict[str, Any]) -> Any:
+        """Dispatch a meta tool call. Returns the decoded result."""
+        handler = self._handlers.get(name)
+        if handler is None:
+            raise ValueError(f"Unknown meta tool: {name}")
+        return await handler(arguments)
 
     # ─── Handlers ──────────────────────────────────────────────────
 
-    async def _configure(self, arguments: dict[str, Any]) -> str:
-        result = await self._config_manager.update_configuration(**arguments)
-        return json.dumps(result, indent=2, default=str)
+    async def _configure(self, arguments: dict[str, Any]) -> Any:
+        return await self._config_manager.update_configuration(**arguments)
 
-    async def _test_connection(self) -> str:
-        result = await self._config_manager.test_configuration()
-        return json.dumps(result, indent=2, default=str)
+    async def _test_connection(self, arguments: dict[str, Any]) -> Any:
+        return await self._config_manager.test_configuration()
 
-    def _get_configuration(self) -> str:
-        status = self._config_manager.get_configuration_status()
-        return json.dumps(status, indent=2, default=str)
+    async def _get_configuration(self, arguments: dict[str, Any]) -> Any:
+        return self._config_manager.get_configuration_status()
 
-    async def _refresh_tools(self) -> str:
+    async def _refresh_tools(self, arguments: dict[str, Any]) -> Any:
         if self._refresh_fn is None:
-            return json.dumps({"error": "Refresh callback not set"})
+            return {"error": "Refresh callback not set"}
         count = await self._refresh_fn()
-        return json.dumps(
-            {
-                "success": True,
-                "message": f"Refreshed tool list — {count} tools discovered",
-                "tool_count": count,
-            }
-        )
+        return {
+            "success": True,
+            "message": f"Refreshed tool list — {count} tools discovered",
+            "tool_count": count,
+        }
 
-    def _list_extensions(self) -> str:
+    async def _list_extensions(self, arguments: dict[str, Any]) -> Any:
         if self._get_extensions_fn is None:
-            return json.dumps({"error": "Extension query callback not set"})
+            return {"error": "Extension query callback not set"}
         extensions = self._get_extensions_fn()
-        return json.dumps(
-            {
-                "extensions": extensions,
-                "total_extensions": len(extensions),
-                "total_tools": sum(extensions.values()),
-            },
-            indent=2,
-        )
+        return {
+            "extensions": extensions,
+            "total_extensions": len(extensions),
+            "total_tools": sum(extensions.values()),
+        }
 
-    async def _pay_lightning_address(self, arguments: dict[str, Any]) -> str:
+    async def _pay_lightning_address(self, arguments: dict[str, Any]) -> Any:
         address = arguments["lightning_address"]
         amount = arguments["amount_sats"]
         comment = arguments.get("comment")
         client = await self._config_manager.get_client()
-        result = await client.pay_lightning_address(address, amount, comment)
-        return json.dumps(result, indent=2, default=str)
+        return await client.pay_lightning_address(address, amount, comment)
+
+    async def _get_wallet_snapshot(self, arguments: dict[str, Any]) -> Any:
+        limit = arguments.get("limit", 10)
+        client = await self._config_manager.get_client()
+        results: tuple[Any, Any] = await asyncio.gather(
+            client.get("/api/v1/wallet"),
+            client.get("/api/v1/payments", params={"limit": limit}),
+            return_exceptions=True,
+        )
+        snapshot: dict[str, Any] = {}
+        for key, value in zip(("wallet", "payments"), results):
+            # BaseException so a cancelled fetch isn't reported as data
+            if isinstance(value, BaseException):
+                snapshot[key] = {"error": str(value)}
+            else:
+                snapshot[key] = value
+        return snapshot
+
+    async def _batch_call_tools(self, arguments: dict[str, Any]) -> Any:
+        if self._call_tool_fn is None:
+            return {"error": "Tool call callback not set"}
+        calls = arguments["calls"]
+        # Reject the whole batch up front so no call runs if any would write
+        rejected = [c["name"] for c in calls if not self._is_read_only(c["name"])]
+        if rejected:
+            raise ValueError(
+                "batch_call_tools only runs read-only tools; not allowed: "
+                + ", ".join(rejected)
+            )
+        results = await asyncio.gather(
+            *(self._call_tool_fn(c["name"], c.get("arguments", {})) for c in calls),
+            return_exceptions=True,
+        )
+        items: list[dict[str, Any]] = []
+        for call, result in zip(calls, results):
+            if isinstance(result, LNbitsError):
+                items.append(
+                    {"name": call["name"], "error": f"LNbits API error: {result}"}
+                )
+            elif isinstance(result, BaseException):
+                items.append({"name": call["name"], "error": str(result)})
+            else:
+                items.append({"name": call["name"], "result": result})
+        return {"results": items}
+
+    def _is_read_only(self, name: str) -> bool:
+        if name in META_TOOL_NAMES:
+            return name in READ_ONLY_META_TOOL_NAMES
+        return self._is_read_only_fn is not None and self._is_read_only_fn(name)
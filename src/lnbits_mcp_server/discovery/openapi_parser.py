@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 import httpx
+import orjson
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -41,9 +42,16 @@ class DiscoveredOperation:
 class OpenAPIParser:
     """Fetches /openapi.json and converts it to DiscoveredOperation list."""
 
-    def __init__(self, base_url: str, timeout: int = 15):
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 15,
+        http_client: httpx.AsyncClient | None = None,
+    ):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        # Optional pooled client; reusing it skips a fresh TCP/TLS handshake
+        self._http_client = http_client
 
     # ------------------------------------------------------------------
     # Public API
@@ -63,10 +71,14 @@ class OpenAPIParser:
     # ------------------------------------------------------------------
 
     async def _fetch_spec(self) -> dict[str, Any]:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            resp = await client.get(f"{self.base_url}/openapi.json")
-            resp.raise_for_status()
-            return resp.json()
+        url = f"{self.base_url}/openapi.json"
+        if self._http_client is not None:
+            resp = await self._http_client.get(url, timeout=self.timeout)
+        else:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                resp = await client.get(url)
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
 
     # ------------------------------------------------------------------
     # Parse
@@ -38,6 +38,8 @@ class ToolRegistry:
     def __init__(self, config: RegistryConfig | None = None):
         self.config = config or RegistryConfig()
         self._operations: dict[str, DiscoveredOperation] = {}
+        # Converted MCP tools by name, built on first request after each load()
+        self._mcp_tools: dict[str, Tool] | None = None
         self.last_refresh: float = 0.0
 
     # ------------------------------------------------------------------
@@ -47,6 +49,7 @@ class ToolRegistry:
     def load(self, operations: list[DiscoveredOperation]) -> int:
         """Filter *operations* and store them. Returns count of accepted tools."""
         self._operations.clear()
+        self._mcp_tools = None
         accepted = 0
         for op in operations:
             if self._should_skip(op):
@@ -89,11 +92,23 @@ class ToolRegistry:
     # ------------------------------------------------------------------
 
     def get_mcp_tools(self) -> list[Tool]:
-        """Convert all registered operations to MCP Tool objects."""
-        tools: list[Tool] = []
-        for op in self._operations.values():
-            tools.append(self._to_mcp_tool(op))
-        return tools
+        """Return MCP Tool objects for all registered operations.
+
+        Conversion (schema sanitization + Tool validation) runs once per
+        load(); later calls reuse the cached objects.
+        """
+        return list(self._get_mcp_tool_map().values())
+
+    def get_mcp_tool(self, tool_name: str) -> Tool | None:
+        """Return the MCP Tool for *tool_name*, or None if not registered."""
+        return self._get_mcp_tool_map().get(tool_name)
+
+    def _get_mcp_tool_map(self) -> dict[str, Tool]:
+        if self._mcp_tools is None:
+            self._mcp_tools = {
+                name: self._to_mcp_tool(op) for name, op in self._operations.items()
+            }
+        return self._mcp_tools
 
     def _to_mcp_tool(self, op: DiscoveredOperation) -> Tool:
         description = CURATED_DESCRIPTIONS.get(
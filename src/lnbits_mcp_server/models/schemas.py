@@ -6,7 +6,9 @@ returns raw JSON from the LNbits API.
 
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field, HttpUrl, validator
+from pydantic import BaseModel, Field, HttpUrl
+
+from ..utils.auth import AuthMethod
 
 
 class ConfigureLNbitsRequest(BaseModel):
@@ -24,7 +26,7 @@ class ConfigureLNbitsRequest(BaseModel):
     oauth2_token: Optional[str] = Field(
         description="OAuth2 token for authentication", default=None
     )
-    auth_method: Optional[str] = Field(
+    auth_method: Optional[AuthMethod] = Field(
         description="Authentication method", default=None
     )
     timeout: Optional[int] = Field(
@@ -34,14 +36,6 @@ class ConfigureLNbitsRequest(BaseModel):
         description="Rate limit per minute", default=None, ge=1, le=1000
     )
 
-    @validator("auth_method")
-    def validate_auth_method(cls, v):
-        if v is not None:
-            valid = ["api_key_header", "api_key_query", "http_bearer", "oauth2"]
-            if v not in valid:
-                raise ValueError(f"auth_method must be one of: {valid}")
-        return v
-
     class Config:
         extra = "forbid"
 
@@ -1,24 +1,46 @@
 """LNbits MCP Server — dynamic tool discovery from OpenAPI spec."""
 
 import asyncio
+import logging
+import queue
 import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Dict, Optional
 
+import orjson
 import structlog
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 from mcp import types
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool
+from pydantic import ValidationError
 
 from .client import LNbitsConfig, LNbitsError
 from .discovery.dispatcher import Dispatcher
 from .discovery.meta_tools import META_TOOL_NAMES, MetaTools
 from .discovery.openapi_parser import OpenAPIParser
 from .discovery.tool_registry import ToolRegistry
+from .utils.logs import log_enabled
 from .utils.runtime_config import RuntimeConfigManager
+from .utils.serialization import to_json_text
 
 logger = structlog.get_logger(__name__)
+# Stdlib logger behind it, fetched once for log_enabled checks
+_log = logging.getLogger(__name__)
+
+# After a failed discovery, list_tools serves meta tools only for this many
+# seconds instead of paying another fetch timeout straight away
+_DISCOVERY_RETRY_INTERVAL = 30.0
+
+
+def _text_result(text: str) -> list[types.TextContent]:
+    """Wrap a tool's text output in the MCP content envelope."""
+    return [types.TextContent(type="text", text=text)]
 
 
 class LNbitsMCPServer:
@@ -38,12 +60,31 @@ class LNbitsMCPServer:
         self.meta_tools.set_callbacks(
             refresh_fn=self._discover_tools,
             get_extensions_fn=self.registry.get_extensions,
+            call_tool_fn=self._run_tool,
+            is_read_only_fn=self._is_read_only_tool,
         )
 
         # Wire config change callback
         self.config_manager.on_config_changed = self._on_config_changed
 
         self._discovery_done = False
+        # Background discovery started by run(); see _start_discovery
+        self._discovery_task: Optional[asyncio.Future] = None
+        # time.monotonic() of the last failed discovery, None after a success
+        self._discovery_failed_at: Optional[float] = None
+
+        # Compiled input-schema validators by tool name, reset on rediscovery
+        self._validators: Dict[str, Validator] = {}
+        # Combined meta + discovered tool list, reset on rediscovery
+        self._tools: Optional[list[Tool]] = None
+
+        self._init_options = InitializationOptions(
+            server_name="lnbits-mcp-server",
+            server_version="0.2.0",
+            capabilities=types.ServerCapabilities(
+                tools=types.ToolsCapability(listChanged=True),
+            ),
+        )
 
         # Register MCP handlers
         self._register_handlers()
@@ -55,11 +96,16 @@ class LNbitsMCPServer:
     async def _discover_tools(self) -> int:
         """Fetch OpenAPI spec and populate the tool registry. Returns tool count."""
         url = str(self.config_manager.config.lnbits_url).rstrip("/")
-        parser = OpenAPIParser(url)
         try:
+            # Share the client's connection pool so discovery warms it up
+            client = await self.config_manager.get_client()
+            parser = OpenAPIParser(url, http_client=await client.get_http_client())
             operations = await parser.fetch_and_parse()
             count = self.registry.load(operations)
+            self._validators.clear()
+            self._tools = None
             self._discovery_done = True
+            self._discovery_failed_at = None
             logger.info("Tool discovery complete", tool_count=count)
 
             # Notify MCP clients that the tool list changed
@@ -70,15 +116,35 @@ class LNbitsMCPServer:
 
             return count
         except Exception as e:
+            self._discovery_failed_at = time.monotonic()
             logger.warning(
                 "Tool discovery failed — serving meta tools only", error=str(e)
             )
             return 0
 
+    def _start_discovery(self) -> None:
+        """Start discovery in the background so the OpenAPI fetch, and the
+        pooled connection it opens, overlap the MCP initialize handshake."""
+        self._discovery_task = asyncio.ensure_future(self._discover_tools())
+
     async def _on_config_changed(self) -> None:
         """Called when the user reconfigures the LNbits URL."""
+        # A startup fetch still in flight targets the old URL; drop it
+        task = self._discovery_task
+        self._discovery_task = None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.wait([task])
         await self._discover_tools()
 
+    def _recently_failed(self) -> bool:
+        """True if discovery failed less than _DISCOVERY_RETRY_INTERVAL ago."""
+        failed_at = self._discovery_failed_at
+        return (
+            failed_at is not None
+            and time.monotonic() - failed_at < _DISCOVERY_RETRY_INTERVAL
+        )
+
     # ------------------------------------------------------------------
     # MCP handlers
     # ------------------------------------------------------------------
@@ -86,82 +152,111 @@ class LNbitsMCPServer:
     def _register_handlers(self) -> None:
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
-            # Lazy discovery on first call
+            # Lazy discovery on first call, unless the startup fetch succeeded
             if not self._discovery_done:
-                await self._discover_tools()
-
-            tools = self.meta_tools.get_tools() + self.registry.get_mcp_tools()
-            logger.info("list_tools", count=len(tools))
+                task = self._discovery_task
+                if task is not None and not task.done():
+                    # wait() neither cancels the task nor raises if it was
+                    await asyncio.wait([task])
+                if not self._discovery_done and not self._recently_failed():
+                    await self._discover_tools()
+
+            tools = self._tools
+            if tools is None:
+                tools = self.meta_tools.get_tools() + self.registry.get_mcp_tools()
+                self._tools = tools
+            if log_enabled(_log, logging.INFO):
+                logger.info("list_tools", count=len(tools))
             return tools
 
-        @self.server.call_tool()
+        # Input validation is done here with cached validators rather than by
+        # the SDK, which rebuilds and re-checks the schema on every call.
+        @self.server.call_tool(validate_input=False)
         async def call_tool(
             name: str, arguments: Dict[str, Any]
         ) -> list[types.TextContent]:
+            # Raised outside the try so the SDK reports it with isError=True
+            self._validate_arguments(name, arguments)
             try:
-                logger.info("call_tool", tool=name)
-
-                # Meta tools
-                if name in META_TOOL_NAMES:
-                    text = await self.meta_tools.call_tool(name, arguments)
-                    return [types.TextContent(type="text", text=text)]
-
-                # Discovered tools
-                op = self.registry.get(name)
-                if op is None:
-                    return [
-                        types.TextContent(
-                            type="text",
-                            text=f"Unknown tool: {name}",
-                        )
-                    ]
-
-                client = await self.config_manager.get_client()
-                text = await self.dispatcher.dispatch(
-                    client,
-                    op,
-                    arguments,
-                    access_token=self.config_manager.config.access_token,
-                )
-                return [types.TextContent(type="text", text=text)]
+                if log_enabled(_log, logging.INFO):
+                    logger.info("call_tool", tool=name)
+                return _text_result(await self._execute_tool(name, arguments))
 
             except LNbitsError as e:
                 logger.error("LNbits API error", error=str(e), tool=name)
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"LNbits API error: {e}",
-                    )
-                ]
+                return _text_result(f"LNbits API error: {e}")
+            except ValidationError as e:
+                # Expected for bad configure_lnbits input; no traceback needed
+                logger.warning("Validation error", error=str(e), tool=name)
+                return _text_result(f"Validation error: {e}")
             except Exception as e:
                 logger.error("Unexpected error", error=str(e), tool=name, exc_info=True)
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {e}",
-                    )
-                ]
+                return _text_result(f"Error: {e}")
+
+    async def _execute_tool(self, name: str, arguments: Dict[str, Any]) -> str:
+        """Run an already-validated tool call and return its text result."""
+        return to_json_text(await self._execute_tool_raw(name, arguments))
+
+    async def _execute_tool_raw(self, name: str, arguments: Dict[str, Any]) -> Any:
+        """Run an already-validated tool call and return its decoded result."""
+        if name in META_TOOL_NAMES:
+            return await self.meta_tools.call_tool_raw(name, arguments)
+
+        op = self.registry.get(name)
+        if op is None:
+            return f"Unknown tool: {name}"
+
+        client = await self.config_manager.get_client()
+        return await self.dispatcher.dispatch_raw(
+            client,
+            op,
+            arguments,
+            access_token=self.config_manager.config.access_token,
+        )
+
+    async def _run_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
+        """Validate and run one tool call; used by ``batch_call_tools``."""
+        self._validate_arguments(name, arguments)
+        return await self._execute_tool_raw(name, arguments)
+
+    def _is_read_only_tool(self, name: str) -> bool:
+        """Return True if *name* is a discovered GET operation."""
+        op = self.registry.get(name)
+        return op is not None and op.method == "GET"
+
+    def _validate_arguments(self, name: str, arguments: Dict[str, Any]) -> None:
+        """Validate *arguments* against the tool's advertised inputSchema."""
+        validator = self._validators.get(name)
+        if validator is None:
+            tool = self.meta_tools.get_tool(name) or self.registry.get_mcp_tool(name)
+            if tool is None:
+                return  # call_tool reports unknown tools itself
+            schema = tool.inputSchema
+            validator = validator_for(schema)(schema)
+            self._validators[name] = validator
+        error = best_match(validator.iter_errors(arguments))
+        if error is not None:
+            raise ValueError(f"Input validation error: {error.message}")
 
     # ------------------------------------------------------------------
     # Run
     # ------------------------------------------------------------------
 
     async def run(self) -> None:
-        logger.info("Starting LNbits MCP server")
+        config = self.config_manager.config
+        logger.info(
+            "Starting LNbits MCP server",
+            lnbits_url=str(config.lnbits_url),
+            auth_method=config.auth_method.value,
+            api_key_set=bool(config.api_key),
+        )
+        self._start_discovery()
         try:
             async with stdio_server() as (read_stream, write_stream):
-                await self.server.run(
-                    read_stream,
-                    write_stream,
-                    InitializationOptions(
-                        server_name="lnbits-mcp-server",
-                        server_version="0.2.0",
-                        capabilities=types.ServerCapabilities(
-                            tools=types.ToolsCapability(listChanged=True),
-                        ),
-                    ),
-                )
+                await self.server.run(read_stream, write_stream, self._init_options)
         finally:
+            if self._discovery_task is not None:
+                self._discovery_task.cancel()
             await self.config_manager.close()
 
 
@@ -170,25 +265,68 @@ class LNbitsMCPServer:
 # ------------------------------------------------------------------
 
 
-async def async_main() -> None:
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """structlog JSON serializer backed by orjson (stdlib loggers need str)."""
+    return orjson.dumps(obj, default=kwargs.get("default")).decode()
+
+
+# No call site logs with %-style positional args, stack_info or bytes values,
+# so PositionalArgumentsFormatter/StackInfoRenderer/UnicodeDecoder are left out.
+_LOG_PROCESSORS = (
+    structlog.stdlib.filter_by_level,
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.processors.format_exc_info,
+    structlog.processors.JSONRenderer(serializer=_orjson_dumps),
+)
+
+
+def _configure_logging() -> None:
+    """Configure structlog once; later calls keep the existing setup."""
+    if structlog.is_configured():
+        return
     structlog.configure(
-        processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer(),
-        ],
+        processors=list(_LOG_PROCESSORS),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         wrapper_class=structlog.stdlib.BoundLogger,
         cache_logger_on_first_use=True,
     )
 
+
+def _start_log_listener() -> Optional[QueueListener]:
+    """Write log records to stderr from a background thread.
+
+    A stderr write blocks when the MCP client is slow to drain the pipe; a
+    QueueHandler keeps that off the event loop. Returns ``None`` (and does
+    nothing) if the root logger already has handlers.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, logging.StreamHandler(sys.stderr))
+    root.addHandler(QueueHandler(log_queue))
+    listener.start()
+    return listener
+
+
+def _stop_log_listener(listener: QueueListener) -> None:
+    """Flush and stop *listener*, then detach its QueueHandler from the root
+    logger so later records fall back to logging's default stderr output
+    instead of piling up in a queue nobody drains."""
+    listener.stop()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+            root.removeHandler(handler)
+
+
+async def async_main() -> None:
+    _configure_logging()
+    listener = _start_log_listener()
+
     try:
         server = LNbitsMCPServer()
         await server.run()
@@ -197,11 +335,19 @@ async def async_main() -> None:
     except Exception as e:
         logger.error("Server error", error=str(e), exc_info=True)
         sys.exit(1)
+    finally:
+        if listener is not None:
+            _stop_log_listener(listener)
 
 
 def main() -> None:
     """Synchronous entry point for console script."""
-    asyncio.run(async_main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(async_main())
+    else:
+        uvloop.run(async_main())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,13 @@
+"""Log-level checks shared by the hot paths."""
+
+import logging
+
+
+def log_enabled(log: logging.Logger, level: int) -> bool:
+    """Return True if the stdlib logger *log* would emit events at *level*.
+
+    structlog only drops a filtered event after the call has built its
+    kwargs, so hot paths check the underlying logger first to skip that work.
+    Callers pass a module-level logger so the lookup happens once, at import.
+    """
+    return log.isEnabledFor(level)
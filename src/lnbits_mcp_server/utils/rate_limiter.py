@@ -0,0 +1,53 @@
+"""Rate limiting utilities for LNbits API requests."""
+
+import asyncio
+import time
+from types import TracebackType
+from typing import Optional, Type
+
+
+class TokenBucket:
+    """Async token-bucket rate limiter.
+
+    Allows bursts of up to ``rate`` acquisitions and refills continuously at
+    ``rate`` tokens per ``period`` seconds. Usable as an async context manager.
+    """
+
+    def __init__(self, rate: float, period: float = 60.0):
+        if rate <= 0 or period <= 0:
+            raise ValueError("rate and period must be positive")
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._tokens = min(self.rate, self._tokens + elapsed * self.rate / self.period)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        # The lock queues waiters so tokens are handed out in arrival order;
+        # a cancelled waiter releases it without consuming a token.
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+
+    async def __aenter__(self) -> "TokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        return None
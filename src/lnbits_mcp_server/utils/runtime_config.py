@@ -39,6 +39,10 @@ class RuntimeConfigManager:
 
     async def get_client(self) -> LNbitsClient:
         """Get the current LNbits client, creating one if necessary."""
+        # Fast path: reading the attribute is atomic, so only creation locks
+        client = self._client
+        if client is not None:
+            return client
         with self._lock:
             if not self._client:
                 self._client = LNbitsClient(self._config)
@@ -76,28 +80,24 @@ class RuntimeConfigManager:
             original_config = self._config.model_copy()
             try:
                 config_dict = self._config.model_dump()
-                if lnbits_url is not None:
-                    config_dict["lnbits_url"] = lnbits_url
-                if api_key is not None:
-                    config_dict["api_key"] = api_key
-                if bearer_token is not None:
-                    config_dict["bearer_token"] = bearer_token
-                if oauth2_token is not None:
-                    config_dict["oauth2_token"] = oauth2_token
-                if auth_method is not None:
-                    config_dict["auth_method"] = auth_method
-                if timeout is not None:
-                    config_dict["timeout"] = timeout
-                if rate_limit_per_minute is not None:
-                    config_dict["rate_limit_per_minute"] = rate_limit_per_minute
-                if access_token is not None:
-                    config_dict["access_token"] = access_token
+                updates = {
+                    "lnbits_url": lnbits_url,
+                    "api_key": api_key,
+                    "bearer_token": bearer_token,
+                    "oauth2_token": oauth2_token,
+                    "auth_method": auth_method,
+                    "timeout": timeout,
+                    "rate_limit_per_minute": rate_limit_per_minute,
+                    "access_token": access_token,
+                }
+                config_dict.update(
+                    (key, value) for key, value in updates.items() if value is not None
+                )
 
                 new_config = LNbitsConfig(**config_dict)
 
                 if self._client:
-                    if hasattr(self._client, "close"):
-                        await self._client.close()
+                    await self._client.close()
                     self._client = None
 
                 self._config = new_config
@@ -208,8 +208,7 @@ class RuntimeConfigManager:
         """Close the configuration manager and cleanup resources."""
         with self._lock:
             if self._client:
-                if hasattr(self._client, "close"):
-                    await self._client.close()
+                await self._client.close()
                 self._client = None
 
     @asynccontextmanager
@@ -0,0 +1,19 @@
+"""Serialization helpers for tool results returned to MCP clients."""
+
+from typing import Any
+
+import orjson
+
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def to_json_text(obj: Any) -> str:
+    """Render a tool result as indented JSON text (LLMs handle JSON well).
+
+    Strings are returned unchanged rather than re-quoted. Datetimes are
+    rendered as ISO-8601; other values that aren't natively JSON-serializable
+    fall back to ``str()``.
+    """
+    if isinstance(obj, str):
+        return obj
+    return orjson.dumps(obj, default=str, option=_JSON_OPTIONS).decode()
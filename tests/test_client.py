@@ -1,5 +1,10 @@
 """Tests for LNbitsConfig and LNbitsClient."""
 
+import asyncio
+import json
+import logging
+from unittest.mock import patch
+
 import httpx
 import pytest
 
@@ -23,6 +28,10 @@ class TestLNbitsConfig:
         assert cfg.timeout == 30
         assert cfg.max_retries == 3
         assert cfg.rate_limit_per_minute == 60
+        assert cfg.max_concurrent == 20
+        assert cfg.cache_ttl == 2.0
+        assert cfg.http2_enabled is True
+        assert cfg.max_connections == 20
 
     def test_env_var_loading(self, monkeypatch):
         monkeypatch.setenv("LNBITS_ACCESS_TOKEN", "jwt-tok-123")
@@ -87,6 +96,55 @@ class TestLNbitsClient:
             with pytest.raises(LNbitsError, match="Insufficient balance"):
                 await client.post("/api/v1/payments", json={"out": True})
 
+    async def test_json_body_sent_preserialized(self, httpx_mock):
+        httpx_mock.add_response(
+            method="POST",
+            url="https://demo.lnbits.com/api/v1/payments",
+            json={"payment_hash": "abc"},
+        )
+        async with LNbitsClient() as client:
+            await client.post(
+                "/api/v1/payments",
+                json={"out": False, "amount": 100},
+                headers={"X-Extra": "1"},
+            )
+        request = httpx_mock.get_request()
+        assert json.loads(request.content) == {"out": False, "amount": 100}
+        assert request.headers["Content-Type"] == "application/json"
+        assert request.headers["X-Extra"] == "1"
+
+    async def test_request_non_json_error_body_truncated(self, httpx_mock):
+        httpx_mock.add_response(
+            url="https://demo.lnbits.com/api/v1/wallet",
+            status_code=502,
+            content=b"<html>" + b"x" * 10_000,
+        )
+        async with LNbitsClient() as client:
+            with pytest.raises(LNbitsError) as exc_info:
+                await client.get("/api/v1/wallet")
+        message = str(exc_info.value)
+        assert message.startswith("API request failed: 502 - <html>")
+        assert len(message) < 300
+        assert exc_info.value.status_code == 502
+
+    async def test_request_logged_at_info(self, httpx_mock):
+        httpx_mock.add_response(
+            method="POST",
+            url="https://demo.lnbits.com/api/v1/payments",
+            json={"payment_hash": "abc"},
+        )
+        stdlib_logger = logging.getLogger("lnbits_mcp_server.client")
+        stdlib_logger.setLevel(logging.INFO)
+        try:
+            with patch("lnbits_mcp_server.client.logger") as log:
+                async with LNbitsClient() as client:
+                    await client.post("/api/v1/payments", json={"out": False})
+        finally:
+            stdlib_logger.setLevel(logging.NOTSET)
+        log.info.assert_called_once_with(
+            "API request", method="POST", path="/api/v1/payments", status_code=200
+        )
+
     async def test_request_network_error(self, httpx_mock):
         httpx_mock.add_exception(
             httpx.ConnectError("Connection refused"),
@@ -96,6 +154,153 @@ class TestLNbitsClient:
             with pytest.raises(LNbitsError, match="Request failed"):
                 await client.get("/api/v1/wallet")
 
+    async def test_concurrent_identical_gets_are_coalesced(self, httpx_mock):
+        httpx_mock.add_response(
+            url="https://demo.lnbits.com/api/v1/wallet",
+            json={"balance": 1000},
+        )
+        async with LNbitsClient() as client:
+            results = await asyncio.gather(
+                client.get("/api/v1/wallet"),
+                client.get("/api/v1/wallet"),
+                client.get("/api/v1/wallet"),
+            )
+            assert client._inflight == {}
+        assert results == [{"balance": 1000}] * 3
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test_concurrent_gets_with_different_params_not_coalesced(
+        self, httpx_mock
+    ):
+        httpx_mock.add_response(
+            url="https://demo.lnbits.com/api/v1/payments?limit=1",
+            json=[1],
+        )
+        httpx_mock.add_response(
+            url="https://demo.lnbits.com/api/v1/payments?limit=2",
+            json=[1, 2],
+        )
+        async with LNbitsClient() as client:
+            one, two = await asyncio.gather(
+                client.get("/api/v1/payments", params={"limit": 1}),
+                client.get("/api/v1/payments", params={"limit": 2}),
+            )
+        assert one == [1]
+        assert two == [1, 2]
+
+    async def test_repeated_get_served_from_cache(self, httpx_mock):
+        httpx_mock.add_response(
+            url="https://demo.lnbits.com/api/v1/wallet",
+            json={"balance": 1000},
+        )
+        async with LNbitsClient() as client:
+            first = await client.get("/api/v1/wallet")
+            second = await client.get("/api/v1/wallet")
+        assert first == second == {"balance": 1000}
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test_mutating_request_invalidates_get_cache(self, httpx_mock):
+        httpx_mock.add_response(
+            url="https://demo.lnbits.com/api/v1/wallet",
+            json={"balance": 1000},
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url="https://demo.lnbits.com/api/v1/payments",
+            json={"payment_hash": "abc"},
+        )
+        httpx_mock.add_response(
+            url="https://demo.lnbits.com/api/v1/wallet",
+            json={"balance": 900},
+        )
+        async with LNbitsClient() as client:
+            assert await client.get("/api/v1/wallet") == {"balance": 1000}
+            await client.post("/api/v1/payments", json={"out": True})
+            assert await client.get("/api/v1/wallet") == {"balance": 900}
+
+    async def test_get_overlapping_write_is_not_cached(self, httpx_mock):
+        release = asyncio.Event()
+
+        async def slow_wallet(request):
+            await release.wait()
+            return httpx.Response(200, json={"balance": 1000})
+
+        httpx_mock.add_callback(
+            slow_wallet, url="https://demo.lnbits.com/api/v1/wallet"
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url="https://demo.lnbits.com/api/v1/payments",
+            json={"payment_hash": "abc"},
+        )
+        httpx_mock.add_response(
+            url="https://demo.lnbits.com/api/v1/wallet",
+            json={"balance": 900},
+        )
+        async with LNbitsClient() as client:
+            before = asyncio.create_task(client.get("/api/v1/wallet"))
+            await asyncio.sleep(0.01)
+            await client.post("/api/v1/payments", json={"out": True})
+            release.set()
+            assert await before == {"balance": 1000}
+            assert await client.get("/api/v1/wallet") == {"balance": 900}
+            assert await client.get("/api/v1/wallet") == {"balance": 900}
+
+    async def test_get_after_write_does_not_join_older_inflight_get(self, httpx_mock):
+        release = asyncio.Event()
+
+        async def slow_wallet(request):
+            await release.wait()
+            return httpx.Response(200, json={"balance": 1000})
+
+        httpx_mock.add_callback(
+            slow_wallet, url="https://demo.lnbits.com/api/v1/wallet"
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url="https://demo.lnbits.com/api/v1/payments",
+            json={"payment_hash": "abc"},
+        )
+        httpx_mock.add_response(
+            url="https://demo.lnbits.com/api/v1/wallet",
+            json={"balance": 900},
+        )
+        async with LNbitsClient() as client:
+            before = asyncio.create_task(client.get("/api/v1/wallet"))
+            await asyncio.sleep(0.01)
+            await client.post("/api/v1/payments", json={"out": True})
+            after = asyncio.create_task(client.get("/api/v1/wallet"))
+            await asyncio.sleep(0.01)
+            release.set()
+            assert await before == {"balance": 1000}
+            assert await after == {"balance": 900}
+            assert client._inflight == {}
+
+    async def test_callers_get_independent_copies(self, httpx_mock):
+        httpx_mock.add_response(
+            url="https://demo.lnbits.com/api/v1/wallet",
+            json={"balance": 1000},
+        )
+        async with LNbitsClient() as client:
+            first, second = await asyncio.gather(
+                client.get("/api/v1/wallet"), client.get("/api/v1/wallet")
+            )
+            first["balance"] = 0
+            cached = await client.get("/api/v1/wallet")
+        assert second == cached == {"balance": 1000}
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test_get_cache_disabled_with_zero_ttl(self, httpx_mock):
+        httpx_mock.add_response(
+            url="https://demo.lnbits.com/api/v1/wallet",
+            json={"balance": 1000},
+            is_reusable=True,
+        )
+        async with LNbitsClient(LNbitsConfig(cache_ttl=0)) as client:
+            await client.get("/api/v1/wallet")
+            await client.get("/api/v1/wallet")
+        assert len(httpx_mock.get_requests()) == 2
+
     async def test_auth_headers_applied(self, httpx_mock):
         httpx_mock.add_response(
             url="https://demo.lnbits.com/api/v1/wallet",
@@ -108,6 +313,17 @@ class TestLNbitsClient:
         request = httpx_mock.get_request()
         assert request.headers["X-API-KEY"] == "test-api-key-42"
 
+    async def test_query_auth_params_applied(self, httpx_mock):
+        httpx_mock.add_response(
+            url="https://demo.lnbits.com/api/v1/payments?limit=5&api_key=qk",
+            json=[],
+        )
+        cfg = LNbitsConfig(api_key="qk", auth_method=AuthMethod.API_KEY_QUERY)
+        params = {"limit": 5}
+        async with LNbitsClient(cfg) as client:
+            await client.get("/api/v1/payments", params=params)
+        assert params == {"limit": 5}
+
     async def test_resolve_lightning_address_invalid_format(self):
         async with LNbitsClient() as client:
             with pytest.raises(LNbitsError, match="Invalid lightning address"):
@@ -126,6 +342,150 @@ class TestLNbitsClient:
             result = await client.resolve_lightning_address("user@example.com")
         assert result == "https://example.com/lnurlp/cb/1"
 
+    async def test_resolve_lightning_address_cached(self, httpx_mock):
+        httpx_mock.add_response(
+            url="https://example.com/.well-known/lnurlp/user",
+            json={
+                "callback": "https://example.com/lnurlp/cb/1",
+                "minSendable": 1000,
+                "maxSendable": 100000000,
+            },
+        )
+        async with LNbitsClient() as client:
+            first = await client.resolve_lightning_address("user@example.com")
+            second = await client.resolve_lightning_address("user@example.com")
+        assert first == second == "https://example.com/lnurlp/cb/1"
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test_resolve_lightning_address_non_object_body(self, httpx_mock):
+        httpx_mock.add_response(
+            url="https://example.com/.well-known/lnurlp/user",
+            json=["callback", "minSendable", "maxSendable"],
+        )
+        async with LNbitsClient() as client:
+            assert await client.resolve_lightning_address("user@example.com") is None
+
+    async def test_pay_lightning_address_rejects_out_of_range_amount(self, httpx_mock):
+        httpx_mock.add_response(
+            url="https://example.com/.well-known/lnurlp/user",
+            json={
+                "callback": "https://example.com/lnurlp/cb/1",
+                "minSendable": 1000,
+                "maxSendable": 10000,
+            },
+        )
+        async with LNbitsClient() as client:
+            with pytest.raises(LNbitsError, match="outside the range"):
+                await client.pay_lightning_address("user@example.com", 50)
+        # Only the well-known lookup; the callback was never hit
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test_pay_lightning_address_refreshes_stale_bounds(self, httpx_mock):
+        well_known = "https://example.com/.well-known/lnurlp/user"
+        httpx_mock.add_response(
+            url=well_known,
+            json={
+                "callback": "https://example.com/lnurlp/cb/1",
+                "minSendable": 1000,
+                "maxSendable": 10000,
+            },
+        )
+        httpx_mock.add_response(
+            url=well_known,
+            json={
+                "callback": "https://example.com/lnurlp/cb/1",
+                "minSendable": 1000,
+                "maxSendable": 100000000,
+            },
+        )
+        httpx_mock.add_response(
+            url="https://example.com/lnurlp/cb/1?amount=50000",
+            json={"pr": "lnbc500n1..."},
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url="https://demo.lnbits.com/api/v1/payments",
+            json={"payment_hash": "abc"},
+        )
+        async with LNbitsClient() as client:
+            await client.resolve_lightning_address("user@example.com")
+            result = await client.pay_lightning_address("user@example.com", 50)
+        assert result == {"payment_hash": "abc"}
+
+    async def test_pay_lightning_address_refreshes_stale_callback(self, httpx_mock):
+        well_known = "https://example.com/.well-known/lnurlp/user"
+        httpx_mock.add_response(
+            url=well_known,
+            json={
+                "callback": "https://example.com/lnurlp/cb/old",
+                "minSendable": 1000,
+                "maxSendable": 100000000,
+            },
+        )
+        httpx_mock.add_response(
+            url="https://example.com/lnurlp/cb/old?amount=5000", status_code=404
+        )
+        httpx_mock.add_response(
+            url=well_known,
+            json={
+                "callback": "https://example.com/lnurlp/cb/new",
+                "minSendable": 1000,
+                "maxSendable": 100000000,
+            },
+        )
+        httpx_mock.add_response(
+            url="https://example.com/lnurlp/cb/new?amount=5000",
+            json={"pr": "lnbc50n1..."},
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url="https://demo.lnbits.com/api/v1/payments",
+            json={"payment_hash": "abc"},
+        )
+        async with LNbitsClient() as client:
+            await client.resolve_lightning_address("user@example.com")
+            result = await client.pay_lightning_address("user@example.com", 5)
+        assert result == {"payment_hash": "abc"}
+
+    async def test_lnurl_requests_share_pooled_client(self, httpx_mock):
+        httpx_mock.add_response(
+            url="https://example.com/.well-known/lnurlp/user",
+            json={
+                "callback": "https://example.com/lnurlp/cb/1",
+                "minSendable": 1000,
+                "maxSendable": 100000000,
+            },
+        )
+        httpx_mock.add_response(
+            url="https://example.com/lnurlp/cb/1?amount=5000",
+            json={"pr": "lnbc50n1..."},
+        )
+        async with LNbitsClient() as client:
+            callback = await client.resolve_lightning_address("user@example.com")
+            lnurl_client = client._lnurl_client
+            invoice = await client.get_lnurl_pay_invoice(callback, 5000)
+            assert client._lnurl_client is lnurl_client
+        assert invoice == "lnbc50n1..."
+        assert lnurl_client.is_closed
+
+    async def test_close_releases_and_reopens_clients(self):
+        client = LNbitsClient()
+        await client._ensure_client()
+        http_client, lnurl_client = client.client, client._lnurl_client
+        await client.close()
+        assert http_client.is_closed and lnurl_client.is_closed
+        assert client.client is None and client._lnurl_client is None
+        await client._ensure_client()
+        assert not client.client.is_closed
+        await client.close()
+
+    async def test_pool_never_smaller_than_max_concurrent(self):
+        client = LNbitsClient(LNbitsConfig(max_concurrent=50, max_connections=5))
+        with patch.object(httpx, "Limits", wraps=httpx.Limits) as limits:
+            await client._ensure_client()
+        assert limits.call_args_list[0].kwargs["max_connections"] == 50
+        await client.close()
+
     async def test_check_connection_true(self, httpx_mock):
         httpx_mock.add_response(
             url="https://demo.lnbits.com/api/v1/wallet",
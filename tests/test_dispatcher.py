@@ -1,10 +1,11 @@
 """Tests for discovery.dispatcher."""
 
 import json
-from unittest.mock import AsyncMock, MagicMock, PropertyMock
+from unittest.mock import AsyncMock, PropertyMock
 
 import pytest
 
+from lnbits_mcp_server.client import LNbitsClient, LNbitsConfig
 from lnbits_mcp_server.discovery.dispatcher import Dispatcher
 from lnbits_mcp_server.discovery.openapi_parser import DiscoveredOperation
 
@@ -255,11 +256,7 @@ class TestInvoiceEnrichment:
     """Tests for QR code and lightning URI enrichment on invoice creation."""
 
     def _mock_client_with_url(self, url="https://lnbits.example.com"):
-        client = AsyncMock()
-        config = MagicMock()
-        config.lnbits_url = url
-        client.config = config
-        return client
+        return LNbitsClient(LNbitsConfig(lnbits_url=url))
 
     def test_invoice_response_gets_qr_code_and_lightning_uri(self):
         client = self._mock_client_with_url()
@@ -0,0 +1,24 @@
+"""Tests for utils.logs module."""
+
+import logging
+
+from lnbits_mcp_server.utils.logs import log_enabled
+
+
+class TestLogEnabled:
+    def test_follows_stdlib_logger_level(self):
+        logger = logging.getLogger("lnbits_mcp_server.test_logs")
+        logger.setLevel(logging.WARNING)
+        try:
+            assert not log_enabled(logger, logging.INFO)
+            assert log_enabled(logger, logging.ERROR)
+        finally:
+            logger.setLevel(logging.NOTSET)
+
+    def test_inherits_parent_level(self):
+        parent = logging.getLogger("lnbits_mcp_server.test_logs_parent")
+        parent.setLevel(logging.DEBUG)
+        try:
+            assert log_enabled(logging.getLogger(f"{parent.name}.child"), logging.DEBUG)
+        finally:
+            parent.setLevel(logging.NOTSET)
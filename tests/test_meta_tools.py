@@ -1,10 +1,12 @@
 """Tests for discovery.meta_tools."""
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from lnbits_mcp_server.client import LNbitsError
 from lnbits_mcp_server.discovery.meta_tools import META_TOOL_NAMES, MetaTools
 
 
@@ -39,7 +41,7 @@ def meta_tools(config_manager):
 class TestMetaToolDefinitions:
     def test_tool_count(self):
         tools = MetaTools.get_tools()
-        assert len(tools) == 6
+        assert len(tools) == 8
 
     def test_tool_names(self):
         expected = {
@@ -49,9 +51,14 @@ class TestMetaToolDefinitions:
             "refresh_tools",
             "list_extensions",
             "pay_lightning_address",
+            "get_wallet_snapshot",
+            "batch_call_tools",
         }
         assert META_TOOL_NAMES == expected
 
+    def test_every_definition_has_a_handler(self, meta_tools):
+        assert set(meta_tools._handlers) == META_TOOL_NAMES
+
     def test_all_have_schemas(self):
         for tool in MetaTools.get_tools():
             assert tool.inputSchema is not None
@@ -100,3 +107,74 @@ class TestMetaToolCalls:
     async def test_unknown_tool_raises(self, meta_tools):
         with pytest.raises(ValueError, match="Unknown meta tool"):
             await meta_tools.call_tool("nonexistent", {})
+
+    @pytest.mark.asyncio
+    async def test_get_wallet_snapshot(self, meta_tools, config_manager):
+        client = AsyncMock()
+        client.get = AsyncMock(
+            side_effect=[{"id": "w1", "balance": 5000}, [{"payment_hash": "h1"}]]
+        )
+        config_manager.get_client = AsyncMock(return_value=client)
+        result = await meta_tools.call_tool("get_wallet_snapshot", {"limit": 5})
+        parsed = json.loads(result)
+        assert parsed["wallet"]["balance"] == 5000
+        assert parsed["payments"] == [{"payment_hash": "h1"}]
+        client.get.assert_any_call("/api/v1/payments", params={"limit": 5})
+
+    @pytest.mark.asyncio
+    async def test_get_wallet_snapshot_partial_failure(
+        self, meta_tools, config_manager
+    ):
+        client = AsyncMock()
+        client.get = AsyncMock(
+            side_effect=[{"id": "w1"}, LNbitsError("API request failed: 500", 500)]
+        )
+        config_manager.get_client = AsyncMock(return_value=client)
+        result = await meta_tools.call_tool("get_wallet_snapshot", {})
+        parsed = json.loads(result)
+        assert parsed["wallet"] == {"id": "w1"}
+        assert "500" in parsed["payments"]["error"]
+
+    @pytest.mark.asyncio
+    async def test_get_wallet_snapshot_cancelled_fetch_is_an_error(
+        self, meta_tools, config_manager
+    ):
+        client = AsyncMock()
+        client.get = AsyncMock(side_effect=[{"id": "w1"}, asyncio.CancelledError()])
+        config_manager.get_client = AsyncMock(return_value=client)
+        parsed = json.loads(await meta_tools.call_tool("get_wallet_snapshot", {}))
+        assert parsed["wallet"] == {"id": "w1"}
+        assert "error" in parsed["payments"]
+
+    @pytest.mark.asyncio
+    async def test_batch_call_tools(self, meta_tools):
+        async def call_tool(name, arguments):
+            if name == "fails":
+                raise LNbitsError("API request failed: 404", 404)
+            return {"x": arguments.get("x")}
+
+        meta_tools.set_callbacks(call_tool_fn=call_tool, is_read_only_fn=lambda n: True)
+        result = await meta_tools.call_tool(
+            "batch_call_tools",
+            {"calls": [{"name": "a", "arguments": {"x": 1}}, {"name": "fails"}]},
+        )
+        parsed = json.loads(result)
+        assert parsed["results"][0] == {"name": "a", "result": {"x": 1}}
+        assert parsed["results"][1]["name"] == "fails"
+        assert parsed["results"][1]["error"].startswith("LNbits API error")
+
+    @pytest.mark.asyncio
+    async def test_batch_call_tools_rejects_write_meta_tools(self, meta_tools):
+        call_tool = AsyncMock()
+        meta_tools.set_callbacks(call_tool_fn=call_tool, is_read_only_fn=lambda n: True)
+        with pytest.raises(ValueError, match="pay_lightning_address"):
+            await meta_tools.call_tool(
+                "batch_call_tools",
+                {
+                    "calls": [
+                        {"name": "get_configuration"},
+                        {"name": "pay_lightning_address"},
+                    ]
+                },
+            )
+        call_tool.assert_not_called()
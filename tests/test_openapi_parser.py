@@ -1,5 +1,6 @@
 """Tests for discovery.openapi_parser."""
 
+import httpx
 import pytest
 
 from lnbits_mcp_server.discovery.openapi_parser import (
@@ -26,6 +27,27 @@ class TestSlugify:
         assert _slugify("  hello!  ") == "hello"
 
 
+class TestFetchSpec:
+    async def test_uses_shared_client_without_closing_it(
+        self, httpx_mock, openapi_spec
+    ):
+        httpx_mock.add_response(
+            url="http://localhost:5000/openapi.json", json=openapi_spec
+        )
+        async with httpx.AsyncClient() as client:
+            parser = OpenAPIParser("http://localhost:5000", http_client=client)
+            ops = await parser.fetch_and_parse()
+            assert ops
+            assert not client.is_closed
+
+    async def test_raises_on_http_error(self, httpx_mock):
+        httpx_mock.add_response(
+            url="http://localhost:5000/openapi.json", status_code=503
+        )
+        with pytest.raises(httpx.HTTPStatusError):
+            await OpenAPIParser("http://localhost:5000").fetch_and_parse()
+
+
 class TestParseSpec:
     def test_parses_operations(self, parser, openapi_spec):
         ops = parser.parse_spec_dict(openapi_spec)
@@ -0,0 +1,43 @@
+"""Tests for utils.rate_limiter module."""
+
+import asyncio
+import time
+
+import pytest
+
+from lnbits_mcp_server.utils.rate_limiter import TokenBucket
+
+
+class TestTokenBucket:
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+        with pytest.raises(ValueError):
+            TokenBucket(10, period=0)
+
+    async def test_allows_initial_burst(self):
+        bucket = TokenBucket(5, period=60)
+        start = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+        assert time.monotonic() - start < 0.05
+
+    async def test_waits_for_refill_when_empty(self):
+        bucket = TokenBucket(2, period=0.2)
+        await bucket.acquire()
+        await bucket.acquire()
+        start = time.monotonic()
+        async with bucket:
+            pass
+        # One token refills every 0.1s
+        assert time.monotonic() - start >= 0.08
+
+    async def test_cancelled_waiter_does_not_consume_token(self):
+        bucket = TokenBucket(1, period=0.2)
+        await bucket.acquire()
+        waiter = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await asyncio.wait_for(bucket.acquire(), timeout=1)
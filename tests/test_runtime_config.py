@@ -30,6 +30,25 @@ class TestUpdateConfiguration:
         # Config should be unchanged
         assert str(mgr.config.lnbits_url) == original_url
 
+    async def test_update_configuration_sets_each_field(self):
+        mgr = RuntimeConfigManager()
+        await mgr.update_configuration(
+            api_key="key",
+            bearer_token="bearer",
+            oauth2_token="oauth",
+            timeout=7,
+            rate_limit_per_minute=30,
+        )
+        cfg = mgr.config
+        assert (cfg.api_key, cfg.bearer_token, cfg.oauth2_token) == (
+            "key",
+            "bearer",
+            "oauth",
+        )
+        assert (cfg.timeout, cfg.rate_limit_per_minute) == (7, 30)
+        # Omitted fields keep their previous values
+        assert cfg.access_token is None
+
 
 class TestSafeConfig:
     async def test_safe_config_masks_secrets(self):
@@ -68,6 +87,21 @@ class TestGetClient:
         client2 = await mgr.get_client()
         assert client1 is client2
 
+    async def test_update_configuration_closes_previous_client(self):
+        mgr = RuntimeConfigManager()
+        client = await mgr.get_client()
+        client.close = AsyncMock()
+        await mgr.update_configuration(api_key="new-key")
+        client.close.assert_awaited_once()
+        assert await mgr.get_client() is not client
+
+    async def test_close_closes_client(self):
+        mgr = RuntimeConfigManager()
+        client = await mgr.get_client()
+        client.close = AsyncMock()
+        await mgr.close()
+        client.close.assert_awaited_once()
+
 
 class TestAccessToken:
     async def test_access_token_in_update(self):
@@ -0,0 +1,26 @@
+"""Tests for utils.serialization module."""
+
+import json
+from datetime import datetime
+from decimal import Decimal
+
+from lnbits_mcp_server.utils.serialization import to_json_text
+
+
+class TestToJsonText:
+    def test_round_trips_json_values(self):
+        data = {"balance": 1000, "payments": [{"memo": "☕"}], "ok": True}
+        assert json.loads(to_json_text(data)) == data
+
+    def test_datetimes_render_as_iso_8601(self):
+        ts = datetime(2024, 1, 2, 3, 4, 5)
+        assert json.loads(to_json_text({"time": ts})) == {"time": ts.isoformat()}
+
+    def test_non_json_values_fall_back_to_str(self):
+        assert json.loads(to_json_text({"fee": Decimal("0.5")})) == {"fee": "0.5"}
+
+    def test_output_is_indented(self):
+        assert to_json_text({"a": 1}) == '{\n  "a": 1\n}'
+
+    def test_strings_are_not_double_encoded(self):
+        assert to_json_text("lnbc1...") == "lnbc1..."
@@ -1,15 +1,26 @@
 """Integration tests: end-to-end list_tools / call_tool with offline spec."""
 
+import asyncio
 import json
+import logging
+import time
+from logging.handlers import QueueHandler
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
+from mcp import types
 
 from lnbits_mcp_server.client import LNbitsConfig
 from lnbits_mcp_server.discovery.dispatcher import Dispatcher
 from lnbits_mcp_server.discovery.meta_tools import META_TOOL_NAMES, MetaTools
 from lnbits_mcp_server.discovery.openapi_parser import OpenAPIParser
 from lnbits_mcp_server.discovery.tool_registry import ToolRegistry
+from lnbits_mcp_server.server import (
+    LNbitsMCPServer,
+    _start_log_listener,
+    _stop_log_listener,
+)
 from lnbits_mcp_server.utils.runtime_config import RuntimeConfigManager
 
 
@@ -93,6 +104,7 @@ class TestEndToEnd:
             return_value={"payment_hash": "abc123", "payment_request": "lnbc1234..."}
         )
         mock_client.config = LNbitsConfig(lnbits_url="http://localhost:5000")
+        mock_client.base_url = "http://localhost:5000"
 
         payments_op = None
         for name, op in registry._operations.items():
@@ -188,3 +200,199 @@ class TestEndToEnd:
 
         assert payments_tool is not None
         assert "qr_code" in payments_tool.description
+
+
+@pytest.fixture
+def mcp_server(registry):
+    server = LNbitsMCPServer(LNbitsConfig(lnbits_url="http://localhost:5000"))
+    server.registry = registry
+    server._discovery_done = True
+    return server
+
+
+async def _call(server: LNbitsMCPServer, name: str, arguments: dict):
+    handler = server.server.request_handlers[types.CallToolRequest]
+    request = types.CallToolRequest(
+        method="tools/call",
+        params=types.CallToolRequestParams(name=name, arguments=arguments),
+    )
+    return (await handler(request)).root
+
+
+class TestServerCallTool:
+    async def test_invalid_arguments_rejected_before_dispatch(self, mcp_server):
+        mcp_server.meta_tools._pay_lightning_address = AsyncMock()
+        result = await _call(
+            mcp_server,
+            "pay_lightning_address",
+            {"lightning_address": "nope", "amount_sats": 10},
+        )
+        assert result.isError
+        assert result.content[0].text.startswith("Input validation error")
+        mcp_server.meta_tools._pay_lightning_address.assert_not_called()
+
+    async def test_validator_cached_per_tool(self, mcp_server):
+        await _call(mcp_server, "get_configuration", {})
+        validator = mcp_server._validators["get_configuration"]
+        await _call(mcp_server, "get_configuration", {})
+        assert mcp_server._validators["get_configuration"] is validator
+
+    async def test_discovered_tool_validated(self, mcp_server):
+        result = await _call(mcp_server, "payments_create_payments", {"out": "yes"})
+        assert result.isError
+        assert "Input validation error" in result.content[0].text
+
+    async def test_batch_call_tools_validates_each_call(self, mcp_server):
+        result = await _call(
+            mcp_server,
+            "batch_call_tools",
+            {
+                "calls": [
+                    {"name": "get_configuration"},
+                    {"name": "payments_get_payments", "arguments": {}},
+                ]
+            },
+        )
+        assert not result.isError
+        items = json.loads(result.content[0].text)["results"]
+        assert items[0]["result"]["is_configured"] is not None
+        assert "Input validation error" in items[1]["error"]
+
+    @pytest.mark.parametrize(
+        "name",
+        ["configure_lnbits", "pay_lightning_address", "payments_create_payments"],
+    )
+    async def test_batch_call_tools_rejects_write_tools(self, mcp_server, name):
+        mcp_server.meta_tools._pay_lightning_address = AsyncMock()
+        mcp_server.meta_tools._configure = AsyncMock()
+        result = await _call(
+            mcp_server,
+            "batch_call_tools",
+            {"calls": [{"name": "get_configuration"}, {"name": name}]},
+        )
+        mcp_server.meta_tools._pay_lightning_address.assert_not_called()
+        mcp_server.meta_tools._configure.assert_not_called()
+        if name in META_TOOL_NAMES:
+            # Write meta tools are excluded by the schema itself
+            assert result.isError
+        else:
+            assert "only runs read-only tools" in result.content[0].text
+
+    async def test_batch_call_tools_rejects_nesting(self, mcp_server):
+        result = await _call(
+            mcp_server,
+            "batch_call_tools",
+            {"calls": [{"name": "batch_call_tools", "arguments": {"calls": []}}]},
+        )
+        assert result.isError
+
+    async def test_config_validation_error_reported_without_traceback(self, mcp_server):
+        with patch("lnbits_mcp_server.server.logger") as log:
+            result = await _call(
+                mcp_server, "configure_lnbits", {"lnbits_url": "not-a-url"}
+            )
+        assert result.content[0].text.startswith("Validation error:")
+        log.error.assert_not_called()
+
+
+class TestServerListTools:
+    async def _list(self, server: LNbitsMCPServer):
+        handler = server.server.request_handlers[types.ListToolsRequest]
+        request = types.ListToolsRequest(method="tools/list")
+        return (await handler(request)).root.tools
+
+    async def test_tool_list_cached_between_calls(self, mcp_server):
+        first = await self._list(mcp_server)
+        assert len(first) == len(META_TOOL_NAMES) + mcp_server.registry.tool_count
+        assert mcp_server._tools is not None
+        cached = mcp_server._tools
+        await self._list(mcp_server)
+        assert mcp_server._tools is cached
+
+    async def test_rediscovery_resets_cache(self, mcp_server, openapi_spec):
+        await self._list(mcp_server)
+        ops = OpenAPIParser("http://localhost:5000").parse_spec_dict(openapi_spec)
+        with patch.object(
+            OpenAPIParser, "fetch_and_parse", AsyncMock(return_value=ops[:3])
+        ):
+            await mcp_server._discover_tools()
+        assert mcp_server._tools is None
+        tools = await self._list(mcp_server)
+        assert len(tools) == len(META_TOOL_NAMES) + 3
+
+    async def test_waits_for_startup_discovery(self, mcp_server):
+        mcp_server._discovery_done = False
+        calls = 0
+
+        async def discover():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            mcp_server._discovery_done = True
+            return 0
+
+        mcp_server._discover_tools = discover
+        mcp_server._start_discovery()
+        await self._list(mcp_server)
+        assert calls == 1
+
+    async def test_no_immediate_retry_after_failed_startup_discovery(self, mcp_server):
+        mcp_server._discovery_done = False
+        fetch = AsyncMock(side_effect=httpx.ConnectError("down"))
+        with patch.object(OpenAPIParser, "fetch_and_parse", fetch):
+            mcp_server._start_discovery()
+            tools = await self._list(mcp_server)
+        assert fetch.await_count == 1
+        assert len(tools) == len(META_TOOL_NAMES) + mcp_server.registry.tool_count
+
+    async def test_retries_failed_discovery_after_interval(self, mcp_server):
+        mcp_server._discovery_done = False
+        mcp_server._discovery_failed_at = time.monotonic() - 60
+        mcp_server._discover_tools = AsyncMock(return_value=0)
+        await self._list(mcp_server)
+        mcp_server._discover_tools.assert_awaited_once()
+
+    async def test_config_change_cancels_startup_discovery(self, mcp_server):
+        started = asyncio.Event()
+
+        async def slow_fetch(self):
+            started.set()
+            await asyncio.sleep(10)
+
+        with patch.object(OpenAPIParser, "fetch_and_parse", slow_fetch):
+            mcp_server._start_discovery()
+            task = mcp_server._discovery_task
+            await started.wait()
+            with patch.object(
+                mcp_server, "_discover_tools", AsyncMock(return_value=0)
+            ) as discover:
+                await mcp_server._on_config_changed()
+        assert task.cancelled()
+        discover.assert_awaited_once()
+
+
+class TestLogListener:
+    def test_routes_root_logging_through_queue(self, capsys):
+        root = logging.getLogger()
+        with patch.object(root, "handlers", []):
+            listener = _start_log_listener()
+            try:
+                assert isinstance(root.handlers[0], QueueHandler)
+                logging.getLogger("lnbits_mcp_server.test").warning("queued")
+            finally:
+                listener.stop()
+        assert "queued" in capsys.readouterr().err
+
+    def test_stop_detaches_queue_handler(self, capsys):
+        root = logging.getLogger()
+        with patch.object(root, "handlers", []):
+            _stop_log_listener(_start_log_listener())
+            assert root.handlers == []
+            # Late records reach stderr via logging's last-resort handler
+            logging.getLogger("lnbits_mcp_server.test").warning("after stop")
+        assert "after stop" in capsys.readouterr().err
+
+    def test_keeps_existing_handlers(self):
+        root = logging.getLogger()
+        with patch.object(root, "handlers", [logging.NullHandler()]):
+            assert _start_log_listener() is None
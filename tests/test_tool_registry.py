@@ -48,6 +48,16 @@ class TestToolRegistry:
             assert t.description
             assert t.inputSchema
 
+    def test_get_mcp_tools_cached_until_reload(self, operations):
+        reg = ToolRegistry()
+        reg.load(operations)
+        first = reg.get_mcp_tools()
+        second = reg.get_mcp_tools()
+        assert first == second
+        assert all(a is b for a, b in zip(first, second))
+        reg.load([])
+        assert reg.get_mcp_tools() == []
+
     def test_get_extensions(self, operations):
         reg = ToolRegistry(RegistryConfig(exclude_methods=[]))
         reg.load(operations)
@@ -0,0 +1,47 @@
+"""Tests for utils.ttl_cache module."""
+
+from unittest.mock import patch
+
+from lnbits_mcp_server.utils.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    def test_get_returns_default_when_missing(self):
+        cache = TTLCache(ttl=10)
+        assert cache.get("missing") is None
+        assert cache.get("missing", "fallback") == "fallback"
+
+    def test_set_and_get(self):
+        cache = TTLCache(ttl=10)
+        cache.set("k", {"balance": 1})
+        assert cache.get("k") == {"balance": 1}
+
+    def test_entries_expire(self):
+        cache = TTLCache(ttl=5)
+        with patch("lnbits_mcp_server.utils.ttl_cache.time.monotonic") as clock:
+            clock.return_value = 100.0
+            cache.set("k", "v")
+            clock.return_value = 104.9
+            assert cache.get("k") == "v"
+            clock.return_value = 105.0
+            assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_pop_and_clear(self):
+        cache = TTLCache(ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.pop("a")
+        cache.pop("not-there")
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_evicts_oldest_when_full(self):
+        cache = TTLCache(ttl=10, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3